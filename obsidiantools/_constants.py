@@ -1,9 +1,13 @@
 # WIKILINKS AND EMBEDDED FILES: regex that includes any aliases
 # group 0 captures embedded link; group 1 is everything inside [[]]
-WIKILINK_REGEX = r'(!)?\[{2}([^\]\]]+)\]{2}'
+# (a link can't span lines or contain another '[[', which also stops an
+# unclosed '[[' from being scanned to the end of the text)
+WIKILINK_REGEX = r'(!)?\[{2}((?:[^\[\]\n]|\[(?!\[))+)\]{2}'
 
 # TAGS
-TAG_INCLUDE_NESTED_REGEX = r'(?<!\()(?<!\\)#{1}([A-z]+[0-9_\-]*[A-Z0-9]?[^\s]+(?![^\[\[]*\]\]))\/?'
+# (wikilinks are removed from the text before tags are parsed, so there's no
+# lookahead for a closing ']]' - that made the scan quadratic in file size)
+TAG_INCLUDE_NESTED_REGEX = r'(?<!\()(?<!\\)#{1}([A-z]+[0-9_\-]*[A-Z0-9]?[^\s]+)\/?'
 TAG_MAIN_ONLY_REGEX = r'(?<!\()#{1}([A-z]+[0-9_\-]*[A-Z0-9]?)\/?'
 
 # md links: catch URLs or paths
@@ -12,21 +16,18 @@ INLINE_LINK_VIA_MD_ONLY_REGEX = r'\[([^\]]+)\]\(([^)]+)\)'
 
 # helpers:
 WIKILINK_AS_STRING_REGEX = r'\[[^\]]+\]\([^)]+\)'
-EMBEDDED_FILE_LINK_AS_STRING_REGEX = r'!?\[{2}([^\]\]]+)\]{2}'
+EMBEDDED_FILE_LINK_AS_STRING_REGEX = r'!?\[{2}((?:[^\[\]\n]|\[(?!\[))+)\]{2}'
 
 # Sets of extensions via https://help.obsidian.md/How+to/Embed+files :
-# NB: file.ext and file.EXT can exist in same folder
-IMG_EXT_SET = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg',
-               '.PNG', '.JPG', '.JPEG', '.GIF', '.BMP', '.SVG'}
-AUDIO_EXT_SET = {'.mp3', '.webm', '.wav', '.m4a', '.ogg', '.3gp', '.flac',
-                 '.MP3', '.WEBM', '.WAV', '.M4A', '.OGG', '.3GP', '.FLAC'}
-VIDEO_EXT_SET = {'.mp4', '.webm', '.ogv', '.mov', '.mkv',
-                 '.MP4', '.WEBM', '.OGV', '.MOV', '.MKV'}
-PDF_EXT_SET = {'.pdf',
-               '.PDF'}
+# NB: file.ext and file.EXT can exist in same folder; the sets are lowercase,
+# so a file's suffix is lowercased to check it against them
+IMG_EXT_SET = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg'})
+AUDIO_EXT_SET = frozenset({'.mp3', '.webm', '.wav', '.m4a', '.ogg', '.3gp',
+                           '.flac'})
+VIDEO_EXT_SET = frozenset({'.mp4', '.webm', '.ogv', '.mov', '.mkv'})
+PDF_EXT_SET = frozenset({'.pdf'})
 # canvas files:
-CANVAS_EXT_SET = {'.canvas',
-                  '.CANVAS'}
+CANVAS_EXT_SET = frozenset({'.canvas'})
 
 # metadata df cols order:
 METADATA_DF_COLS_GENERIC_TYPE = [
@@ -34,3 +35,7 @@ METADATA_DF_COLS_GENERIC_TYPE = [
     'file_exists',
     'n_backlinks', 'n_wikilinks', 'n_tags', 'n_embedded_files',
     'modified_time']
+
+# fewer md files than this are always read in the main process, as worker
+# processes cost more to start than they save:
+MIN_MD_FILES_FOR_WORKERS = 8
@@ -1,6 +1,8 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from glob import glob
-import numpy as np
+from ._constants import MIN_MD_FILES_FOR_WORKERS
 
 
 def get_relpaths_from_dir(dir_path: Path, *, extension: str) -> list[Path]:
@@ -18,9 +20,51 @@ def get_relpaths_from_dir(dir_path: Path, *, extension: str) -> list[Path]:
     Returns:
         list of Path objects
     """
-    relpaths_list = [Path(p).relative_to(dir_path)
-                     for p in glob(f"{dir_path}/**/*.{extension}",
-                     recursive=True)]
+    relpaths_list = [Path(p)
+                     for p in _get_relpath_strs_by_suffix(
+                         str(dir_path), suffix=f".{extension}")]
+    return relpaths_list
+
+
+def _get_relpath_strs_by_suffix(dirpath: str, *, suffix: str,
+                                reldir: str = '',
+                                include_dirs: set[str] = None,
+                                walk_dirs: set[str] = None) -> list[str]:
+    """Walk a directory with os.scandir, returning relative path strings
+    for the files that end with suffix.
+
+    This matches what glob('**/*{suffix}', recursive=True) gives: hidden
+    files & directories are skipped and files in a directory come before
+    the files in its subdirectories.
+
+    If include_dirs is given (as relative posix paths, with '.' for the
+    directory itself), only the files directly in those directories are
+    returned, and only those directories & the ones in walk_dirs (their
+    parents) are walked."""
+    relpaths_list = []
+    subdirs_list = []
+    include_files = (include_dirs is None
+                     or Path(reldir).as_posix() in include_dirs)
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                if entry.name.startswith('.'):
+                    continue
+                relpath = os.path.join(reldir, entry.name)
+                if entry.is_dir():
+                    if (include_dirs is None
+                            or Path(relpath).as_posix() in include_dirs
+                            or Path(relpath).as_posix() in walk_dirs):
+                        subdirs_list.append((entry.path, relpath))
+                elif include_files and entry.name.endswith(suffix):
+                    relpaths_list.append(relpath)
+    except OSError:  # e.g. dir doesn't exist or can't be read
+        return relpaths_list
+
+    for subdir_path, subdir_relpath in subdirs_list:
+        relpaths_list.extend(_get_relpath_strs_by_suffix(
+            subdir_path, suffix=suffix, reldir=subdir_relpath,
+            include_dirs=include_dirs, walk_dirs=walk_dirs))
     return relpaths_list
 
 
@@ -72,41 +116,82 @@ def get_relpaths_matching_subdirs(dir_path: Path, *,
                                                  extension=extension)
                 if str(i.parent.as_posix()) != '.']
     else:
+        # only walk the subdirs (and the dirs on the way to them), rather
+        # than the whole directory:
+        include_dirs = set(include_subdirs_final)
         if include_root:
-            return [i for i in get_relpaths_from_dir(dir_path,
-                                                     extension=extension)
-                    if str(i.parent.as_posix())
-                    in include_subdirs_final + ['.']]
-        else:
-            return [i for i in get_relpaths_from_dir(dir_path,
-                                                     extension=extension)
-                    if str(i.parent.as_posix())
-                    in include_subdirs_final]
+            include_dirs.add('.')
+        walk_dirs = {subdir.rsplit('/', n)[0]
+                     for subdir in include_subdirs_final
+                     for n in range(1, subdir.count('/') + 1)}
+        return [Path(p)
+                for p in _get_relpath_strs_by_suffix(
+                    str(dir_path), suffix=f".{extension}",
+                    include_dirs=include_dirs, walk_dirs=walk_dirs)]
 
 
 def _get_valid_filepaths_by_ext_set(dirpath: Path, *,
                                     exts: set[str]):
-    all_files = [p.relative_to(dirpath)
-                 for p in Path(dirpath).glob("**/*")
-                 if p.suffix in exts]
+    all_files = [Path(p)
+                 for p in _get_relpath_strs_by_ext_set(str(dirpath),
+                                                       exts=exts)]
     return all_files
 
 
+def _get_relpath_strs_by_ext_set(dirpath: str, *, exts: set[str],
+                                 reldir: str = '') -> list[str]:
+    """Walk a directory with os.scandir, returning relative path strings
+    for the entries that have a suffix in exts (a set of lowercase
+    extensions).
+
+    This matches what Path(dirpath).glob('**/*') gives: hidden files &
+    directories are included, but symlinks to directories aren't
+    walked."""
+    relpaths_list = []
+    subdirs_list = []
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                name = entry.name
+                relpath = os.path.join(reldir, name)
+                # (same as Path(name).suffix.lower())
+                i = name.rfind('.')
+                if 0 < i < len(name) - 1 and name[i:].lower() in exts:
+                    relpaths_list.append(relpath)
+                try:
+                    if entry.is_dir() and not entry.is_symlink():
+                        subdirs_list.append((entry.path, relpath))
+                except OSError:
+                    continue
+    except OSError:  # e.g. dir doesn't exist or can't be read
+        return relpaths_list
+
+    for subdir_path, subdir_relpath in subdirs_list:
+        relpaths_list.extend(_get_relpath_strs_by_ext_set(
+            subdir_path, exts=exts, reldir=subdir_relpath))
+    return relpaths_list
+
+
 def _get_shortest_path_by_filename(relpaths_list: list[Path]) -> dict[str, Path]:
-    # get filename w/ ext only:
-    all_file_names_list = [f.name for f in relpaths_list]
-
-    # get indices of dupe 'filename w/ ext':
-    _, inverse_ix, counts = np.unique(
-        np.array(all_file_names_list),
-        return_inverse=True,
-        return_counts=True,
-        axis=0)
-    dupe_names_ix = np.where(counts[inverse_ix] > 1)[0]
-
-    # get shortest paths via mask:
-    shortest_paths_arr = np.array(all_file_names_list, dtype=object)
-    shortest_paths_arr[dupe_names_ix] = np.array(
-        [str(fpath)
-         for fpath in relpaths_list])[dupe_names_ix]
-    return {fn: path for fn, path in zip(shortest_paths_arr, relpaths_list)}
+    # get counts of 'filename w/ ext', to find the dupes:
+    name_counts = Counter(f.name for f in relpaths_list)
+
+    # filename is the shortest path, unless it's a dupe:
+    return {(str(f) if name_counts[f.name] > 1 else f.name): f
+            for f in relpaths_list}
+
+
+def _map_over_md_files(func, filepaths: list[Path], *,
+                       max_workers: int = 1) -> list:
+    """Call func on each md file, returning the outputs in the order of
+    filepaths.  The files are read in worker processes if max_workers
+    allows it (so func needs to be a module-level func, or a partial of
+    one)."""
+    if (max_workers == 1
+            or len(filepaths) < MIN_MD_FILES_FOR_WORKERS):
+        return [func(f) for f in filepaths]
+    # a few chunks per worker, to balance notes of different sizes:
+    n_workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(filepaths) // (4 * n_workers))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, filepaths, chunksize=chunksize))
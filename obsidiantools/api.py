@@ -3,6 +3,7 @@ import networkx as nx
 import numpy as np
 import pandas as pd
 from collections import Counter
+from functools import partial
 from pathlib import Path
 from itertools import chain
 
@@ -11,21 +12,13 @@ from .md_utils import (get_md_relpaths_matching_subdirs)
 from .canvas_utils import (get_canvas_relpaths_matching_subdirs,
                            _get_all_valid_canvas_file_relpaths)
 # connect
-from .md_utils import (_get_md_front_matter_and_content,
-                       _get_html_from_md_content,
-                       _get_md_links_from_source_text,
-                       _get_unique_md_links_from_source_text,
-                       _get_unique_wikilinks_from_source_text,
-                       _get_all_wikilinks_from_source_text,
-                       _get_all_embedded_files_from_source_text,
-                       get_tags,
-                       _get_all_latex_from_html_content)
+from .md_utils import (_get_connect_info_from_md_file)
 from ._constants import METADATA_DF_COLS_GENERIC_TYPE
-from ._io import _get_shortest_path_by_filename
+from ._io import (_get_shortest_path_by_filename,
+                  _map_over_md_files)
 from .media_utils import _get_all_valid_media_file_relpaths
 # gather:
-from .md_utils import (get_source_text_from_html,
-                       _get_readable_text_from_html)
+from .md_utils import (_get_gather_info_from_md_file)
 # canvas:
 from .canvas_utils import (get_canvas_content,
                            get_canvas_graph_detail)
@@ -138,6 +131,9 @@ class Vault:
         self._md_file_index = self._get_md_relpaths_by_name(
             include_subdirs=include_subdirs,
             include_root=include_root)
+        # (absolute paths are joined once here, for all the file reads:)
+        self._md_file_abspath_index = self._get_abspaths_by_name(
+            self._md_file_index)
         self._canvas_file_index = self._get_canvas_relpaths_by_name(
             include_subdirs=include_subdirs,
             include_root=include_root)
@@ -196,6 +192,7 @@ class Vault:
     @md_file_index.setter
     def md_file_index(self, value) -> dict[str, Path]:
         self._md_file_index = value
+        self._md_file_abspath_index = self._get_abspaths_by_name(value)
 
     @property
     def canvas_file_index(self) -> dict[str, Path]:
@@ -446,7 +443,14 @@ class Vault:
                         dict[tuple[str, str], str]]
              ]:
         """dict of tuple: 'shortest path when possible' filepath with canvas
-        ext (k), to canvas graph detail tuple (v)."""
+        ext (k), to canvas graph detail tuple (v).
+
+        The graph detail is built from the canvas_content_index the first
+        time this is accessed after connecting."""
+        if self._canvas_graph_detail_index is None:
+            self._canvas_graph_detail_index = {
+                f: get_canvas_graph_detail(content_c)
+                for f, content_c in self._canvas_content_index.items()}
         return self._canvas_graph_detail_index
 
     @canvas_graph_detail_index.setter
@@ -458,7 +462,7 @@ class Vault:
         self._canvas_graph_detail_index = value
 
     def connect(self, *, show_nested_tags: bool = False,
-                attachments=False):
+                attachments=False, max_workers: int = 1):
         """connect your notes together by representing the vault as a
         Networkx graph object, G.
 
@@ -479,6 +483,12 @@ class Vault:
                 To include media files in the graph, set this option to True.
                 This will lead to the inclusion of media files' in the
                 backlinks_index.
+            max_workers (int, optional): Defaults to 1, so the md files are
+                read one at a time in the current process.  Set this to a
+                higher number to read md files in parallel across that many
+                worker processes, or None to use all the CPUs on the machine.
+                A vault with only a few md files is always read in the
+                current process.
         """
         if not self._is_connected:
             self._attachments = attachments
@@ -496,92 +506,81 @@ class Vault:
             self._unique_wikilinks_index = {}
 
             # loop through md files:
-            for f, relpath in self._md_file_index.items():
-                self._connect_update_based_on_new_relpath(
-                    relpath, note=f,
-                    show_nested_tags=show_nested_tags)
+            md_info_list = self._get_md_info_list_for_connect(
+                show_nested_tags=show_nested_tags,
+                max_workers=max_workers)
+            for f, md_info in zip(self._md_file_index, md_info_list):
+                self._connect_update_based_on_md_info(
+                    md_info, note=f)
 
             # canvas content:
             # loop through canvas files:
             self._canvas_content_index = {}
-            self._canvas_graph_detail_index = {}
             for f, relpath in self._canvas_file_index.items():
-                content_c = get_canvas_content(
+                self._canvas_content_index[f] = get_canvas_content(
                     self._dirpath / relpath)
-                self._canvas_content_index[f] = content_c
-                G_c, pos_c, edge_labels_c = get_canvas_graph_detail(
-                    content_c)
-                self._canvas_graph_detail_index[f] = G_c, pos_c, edge_labels_c
+            # (graph detail is only built when it is first accessed)
+            self._canvas_graph_detail_index = None
+
+            # the vault dir is walked once for the media & canvas files, for
+            # all the file attrs that are set below:
+            file_relpaths = {
+                'media_file_relpaths': _get_all_valid_media_file_relpaths(
+                    self._dirpath),
+                'canvas_file_relpaths': _get_all_valid_canvas_file_relpaths(
+                    self._dirpath)}
 
             # set these up before graph is created:
-            self._set_canvas_file_attrs()
-            self._set_media_file_attrs()
+            self._set_canvas_file_attrs(**file_relpaths)
+            self._set_media_file_attrs(**file_relpaths)
 
             # graph setup:
             graph_data_dict = self.__get_graph_data_dict(
                 attachments=attachments)
             G = nx.MultiDiGraph(graph_data_dict)
             self._graph = G
-            self._set_graph_related_attributes()
+            self._set_graph_related_attributes(
+                graph_data_dict=graph_data_dict)
 
             # set these again so that they are finally correct
             # (to remove notes / md files from the 'nonexistent_*' attrs,
             # the nonexistent_notes are required from the graph)
-            self._set_canvas_file_attrs()
-            self._set_media_file_attrs()
+            self._set_canvas_file_attrs(**file_relpaths)
+            self._set_media_file_attrs(**file_relpaths)
 
             self._is_connected = True
 
         return self  # fluent
 
-    def _connect_update_based_on_new_relpath(self, relpath: Path, *,
-                                             note: str,
-                                             show_nested_tags: bool):
-        """Individual file read & associated attrs update for the
-        connect method."""
-        exclude_canvas = not self._attachments
-
-        # MAIN file read:
-        front_matter, content = _get_md_front_matter_and_content(
-            self._dirpath / relpath)
-        html = _get_html_from_md_content(content)
-        src_txt = get_source_text_from_html(
-            html, remove_code=True)
-
-        # info from core text:
-        self._md_links_index[note] = (
-            _get_md_links_from_source_text(src_txt))
-        self._unique_md_links_index[note] = (
-            _get_unique_md_links_from_source_text(src_txt))
-        self._embedded_files_index[note] = (
-            _get_all_embedded_files_from_source_text(
-                src_txt, remove_aliases=True)
-            # (aliases are redundant for connect method)
-            )
-        self._wikilinks_index[note] = (
-            _get_all_wikilinks_from_source_text(
-                src_txt, remove_aliases=True,
-                exclude_canvas=exclude_canvas))
-        self._unique_wikilinks_index[note] = (
-            _get_unique_wikilinks_from_source_text(
-                src_txt, remove_aliases=True,
-                exclude_canvas=exclude_canvas))
-        # info from html:
-        self._math_index[note] = (_get_all_latex_from_html_content(
-            html))
-        # split out front matter:
-        self._front_matter_index[note] = front_matter
-
-        # MORE file reads needed for extra info:
-        self._tags_index[note] = get_tags(
-            self._dirpath / relpath,
-            show_nested=show_nested_tags)
-
-    def _set_media_file_attrs(self):
+    def _get_md_info_list_for_connect(self, *, show_nested_tags: bool,
+                                      max_workers: int) -> list[dict]:
+        """Read all the md files for the connect method, in the order of the
+        md_file_index.  The files are read in worker processes if the
+        max_workers arg allows it."""
+        get_md_info = partial(_get_connect_info_from_md_file,
+                              show_nested_tags=show_nested_tags,
+                              exclude_canvas=not self._attachments)
+        return _map_over_md_files(
+            get_md_info, list(self._md_file_abspath_index.values()),
+            max_workers=max_workers)
+
+    def _connect_update_based_on_md_info(self, md_info: dict, *,
+                                         note: str):
+        """Individual file's attrs update for the connect method."""
+        self._md_links_index[note] = md_info['md_links']
+        self._unique_md_links_index[note] = md_info['unique_md_links']
+        self._embedded_files_index[note] = md_info['embedded_files']
+        self._wikilinks_index[note] = md_info['wikilinks']
+        self._unique_wikilinks_index[note] = md_info['unique_wikilinks']
+        self._math_index[note] = md_info['math']
+        self._front_matter_index[note] = md_info['front_matter']
+        self._tags_index[note] = md_info['tags']
+
+    def _set_media_file_attrs(self, **file_relpaths):
         (embedded_files_by_short_path,
          non_embedded_files_by_short_path,
          nonexistent_files_by_short_path) = (
-            self._get_media_file_dicts_tuple())
+            self._get_media_file_dicts_tuple(**file_relpaths))
 
         # only set media file index once:
         if not self._media_file_index:
@@ -594,18 +593,20 @@ class Vault:
         self._isolated_media_files = list(
             non_embedded_files_by_short_path.keys())
 
-    def _set_canvas_file_attrs(self):
+    def _set_canvas_file_attrs(self, **file_relpaths):
         (linked_files_by_short_path,
          non_linked_files_by_short_path,
          nonexistent_files_by_short_path) = (
-            self._get_canvas_file_dicts_tuple())
+            self._get_canvas_file_dicts_tuple(**file_relpaths))
 
         self._nonexistent_canvas_files = list(
             nonexistent_files_by_short_path.keys())
         self._isolated_canvas_files = list(
             non_linked_files_by_short_path.keys())
 
-    def _get_media_file_dicts_tuple(self) \
+    def _get_media_file_dicts_tuple(
+            self, *, media_file_relpaths: list[Path] = None,
+            canvas_file_relpaths: list[Path] = None) \
             -> tuple[dict[str, Path], dict[str, Path], dict[str, Path]]:
         """Return (existent files embedded,
         existent files not embedded,
@@ -614,20 +615,28 @@ class Vault:
         The reason this logic is complex is that media files are embedded in
         md files in the Obsidian app using the shortest possible filepath,
         but they all need to be cross-checked against actual media filepaths.
+
+        The relpaths of the vault's media and canvas files are found from
+        the vault dir, unless they are passed in.
         """
+        if media_file_relpaths is None:
+            media_file_relpaths = _get_all_valid_media_file_relpaths(
+                self._dirpath)
+        if canvas_file_relpaths is None:
+            canvas_file_relpaths = _get_all_valid_canvas_file_relpaths(
+                self._dirpath)
 
         # detail on all embedded files AND ones that exist:
         all_files_embedded_in_notes = list(
             chain.from_iterable(self._embedded_files_index.values()))
-        media_file_relpaths_existent = _get_all_valid_media_file_relpaths(
-            self._dirpath)
         return self.__get_file_dicts_tuple(
             all_files_embedded_in_notes,
-            links_index=self._embedded_files_index,
-            existing_file_relpaths=media_file_relpaths_existent,
-            file_type='media')
+            existing_file_relpaths=media_file_relpaths,
+            other_file_relpaths=canvas_file_relpaths)
 
-    def _get_canvas_file_dicts_tuple(self) \
+    def _get_canvas_file_dicts_tuple(
+            self, *, media_file_relpaths: list[Path] = None,
+            canvas_file_relpaths: list[Path] = None) \
             -> tuple[dict[str, Path], dict[str, Path], dict[str, Path]]:
         """Return (existent files linked,
         existent files not linked,
@@ -636,75 +645,54 @@ class Vault:
         The reason this logic is complex is that media files are embedded in
         md files in the Obsidian app using the shortest possible filepath,
         but they all need to be cross-checked against actual media filepaths.
+
+        The relpaths of the vault's media and canvas files are found from
+        the vault dir, unless they are passed in.
         """
+        if media_file_relpaths is None:
+            media_file_relpaths = _get_all_valid_media_file_relpaths(
+                self._dirpath)
+        if canvas_file_relpaths is None:
+            canvas_file_relpaths = _get_all_valid_canvas_file_relpaths(
+                self._dirpath)
 
         # detail on all linked files AND ones that exist:
         all_files_linked_in_notes = list(
             chain.from_iterable(self._wikilinks_index.values()))
-        canvas_file_relpaths_existent = _get_all_valid_canvas_file_relpaths(
-            self._dirpath)
         return self.__get_file_dicts_tuple(
             all_files_linked_in_notes,
-            links_index=self._wikilinks_index,
-            existing_file_relpaths=canvas_file_relpaths_existent,
-            file_type='canvas')
+            existing_file_relpaths=canvas_file_relpaths,
+            other_file_relpaths=media_file_relpaths)
 
     def __get_file_dicts_tuple(self, linked_files_list: list[str], *,
-                               links_index: dict[list[str]],
                                existing_file_relpaths: list[Path],
-                               file_type: str):
+                               other_file_relpaths: list[Path]):
         # get shortest path for each 'linked' file of chosen type;
         # check whether each exists
         shortest_names_existent = _get_shortest_path_by_filename(
             existing_file_relpaths)
         # for nonexistent files, don't want to catch other types:
-        short_names_not_wanted_set = (
-            set(shortest_names_existent)
-            .union(set(self._nonexistent_notes))
-            .union(set(self._md_file_index)))
-        if file_type == 'canvas':
-            other_fpaths_not_wanted_set = _get_all_valid_media_file_relpaths(
-                self._dirpath)
-        elif file_type == 'media':
-            other_fpaths_not_wanted_set = _get_all_valid_canvas_file_relpaths(
-                self._dirpath)
-        else:
-            raise ValueError('Value for type is either "canvas" or "media".')
-        shortest_names_nonexistent = {
-            fn: Path(fn) for fn in chain(*links_index.values())
-            if fn not in short_names_not_wanted_set
-            and Path(fn) not in other_fpaths_not_wanted_set}
-        shortest_names = {**shortest_names_existent,
-                          **shortest_names_nonexistent}
-
-        # SETS
-        # existent files (either linked or not):
-        set_files_existent_linked = (
-            set(shortest_names_existent)
-            .intersection(set(linked_files_list)))
-        set_files_existent_not_linked = (
-            set(shortest_names_existent)
-            .difference(set_files_existent_linked))
-        # nonexistent files:
-        set_files_nonexistent_linked = (
-            set(linked_files_list)
-            .intersection(set(shortest_names_nonexistent)))
+        short_names_not_wanted_set = {*shortest_names_existent,
+                                      *self._nonexistent_notes,
+                                      *self._md_file_index}
+        # (and the files of the other type, canvas or media, aren't wanted)
+        other_fpaths_not_wanted_set = set(other_file_relpaths)
 
         # DICTS
-        # existent files (either linked or not):
-        linked_files_by_short_path = {
-            short_path: rel_path
-            for short_path, rel_path in shortest_names.items()
-            if short_path in set_files_existent_linked}
-        non_linked_files_by_short_path = {
-            short_path: rel_path
-            for short_path, rel_path in shortest_names.items()
-            if short_path in set_files_existent_not_linked}
-        # nonexistent files:
+        # existent files (either linked or not), sorted in one pass:
+        set_files_linked = set(linked_files_list)
+        linked_files_by_short_path = {}
+        non_linked_files_by_short_path = {}
+        for short_path, rel_path in shortest_names_existent.items():
+            if short_path in set_files_linked:
+                linked_files_by_short_path[short_path] = rel_path
+            else:
+                non_linked_files_by_short_path[short_path] = rel_path
+        # nonexistent files (these are all linked):
         nonexistent_files_by_short_path = {
-            short_path: np.NaN
-            for short_path in shortest_names_nonexistent.keys()
-            if short_path in set_files_nonexistent_linked}
+            fn: np.NaN for fn in linked_files_list
+            if fn not in short_names_not_wanted_set
+            and Path(fn) not in other_fpaths_not_wanted_set}
 
         return (linked_files_by_short_path,
                 non_linked_files_by_short_path,
@@ -712,20 +700,18 @@ class Vault:
 
     def _get_backlink_counts_for_media_files_only(self) -> dict[str, int]:
         dict_out = dict.fromkeys(self._media_file_index.keys(), 0)
-        dict_counts = dict(
-            Counter(list(chain(*self._embedded_files_index.values()))))
         # merge counts into dict_out:
-        dict_out = {**dict_out, **dict_counts}
+        dict_out.update(Counter(
+            chain.from_iterable(self._embedded_files_index.values())))
         return dict_out
 
     def _get_backlink_counts_for_canvas_files_only(self) -> dict[str, int]:
         if not self._attachments:
             raise AttributeError('Set attachments=True in connect() to get backlink counts for canvas files.')
         dict_out = dict.fromkeys(self._canvas_file_index.keys(), 0)
-        dict_counts = dict(
-            Counter(list(chain(*self._wikilinks_index.values()))))
         # merge counts into dict_out:
-        dict_out = {**dict_out, **dict_counts}
+        dict_out.update(Counter(
+            chain.from_iterable(self._wikilinks_index.values())))
         return dict_out
 
     def __get_graph_data_dict(self, *, attachments=False) -> \
@@ -758,30 +744,29 @@ class Vault:
         else:
             # attachments include 'media' files and canvas files:
             # i) use wikilinks & embedded file info for graph edges:
-            d_out = {
-                n: (self._wikilinks_index.get(n, [])
-                    + self._embedded_files_index.get(n, [])
-                    )
-                for n in (set(list(self._wikilinks_index.keys())
-                              + list(self._embedded_files_index.keys())))
-            }
+            # (merged in one pass, in the order of the notes)
+            d_out = {n: list(links)
+                     for n, links in self._wikilinks_index.items()}
+            for n, links in self._embedded_files_index.items():
+                if n in d_out:
+                    d_out[n].extend(links)
+                else:
+                    d_out[n] = list(links)
             # ii) add isolated media files & canvas files as nodes:
-            isolated_files_dict = {
-                short_path: [] for short_path
-                in [*self._isolated_media_files,
-                    *self._isolated_canvas_files]}
-            d_out = {**d_out,
-                     **isolated_files_dict}
+            for short_path in [*self._isolated_media_files,
+                               *self._isolated_canvas_files]:
+                d_out[short_path] = []
             return d_out
 
-    def _set_graph_related_attributes(self):
+    def _set_graph_related_attributes(self, *,
+                                      graph_data_dict: dict[str, list[str]]):
         self._backlinks_index = self._get_backlinks_index(
-            graph=self._graph)
+            graph_data_dict=graph_data_dict)
         self._nonexistent_notes = self._get_nonexistent_notes()
         self._isolated_notes = self._get_isolated_notes(
-            graph=self._graph)
+            graph_data_dict=graph_data_dict)
 
-    def gather(self, *, tags: list[str] = None):
+    def gather(self, *, tags: list[str] = None, max_workers: int = 1):
         """gather the content of your notes so that all the plaintext is
         stored in one place for easy access.
 
@@ -802,32 +787,37 @@ class Vault:
                 their formatting in the final text.  For example, tags=[]
                 will remove all header formatting (e.g. '#', '##' chars)
                 and produces a one-line string.
+            max_workers (int, optional): Defaults to 1, so the md files are
+                read one at a time in the current process.  Set this to a
+                higher number to read md files in parallel across that many
+                worker processes, or None to use all the CPUs on the machine.
+                A vault with only a few md files is always read in the
+                current process.
         """
-        for f, relpath in self._md_file_index.items():
-            self._gather_update_based_on_new_relpath(
-                relpath,
-                note=f, tags=tags)
+        md_info_list = self._get_md_info_list_for_gather(
+            tags=tags, max_workers=max_workers)
+        for f, md_info in zip(self._md_file_abspath_index, md_info_list):
+            self._gather_update_based_on_md_info(
+                md_info, note=f)
         self._is_gathered = True
 
         return self  # fluent
 
-    def _gather_update_based_on_new_relpath(self, relpath: Path, *,
-                                            note: str, tags: list[str]):
-        """Individual file read & associated attrs update for the
-        gather method."""
-        # MAIN file read:
-        _, content = _get_md_front_matter_and_content(
-            self._dirpath / relpath)
-        html = _get_html_from_md_content(content)
-        # (also remove LaTeX for source text:)
-        src_txt = get_source_text_from_html(
-            html, remove_code=True, remove_math=True)
-
-        # 'source' text will not remove any content, but 'readable' will:
-        self._source_text_index[note] = src_txt
-        self._readable_text_index[note] = (
-            _get_readable_text_from_html(
-                html, tags=tags))
+    def _get_md_info_list_for_gather(self, *, tags: list[str],
+                                     max_workers: int) -> list[dict]:
+        """Read all the md files for the gather method, in the order of the
+        md_file_abspath_index.  The files are read in worker processes if
+        the max_workers arg allows it."""
+        get_md_info = partial(_get_gather_info_from_md_file, tags=tags)
+        return _map_over_md_files(
+            get_md_info, list(self._md_file_abspath_index.values()),
+            max_workers=max_workers)
+
+    def _gather_update_based_on_md_info(self, md_info: dict, *,
+                                        note: str):
+        """Individual file's attrs update for the gather method."""
+        self._source_text_index[note] = md_info['source_text']
+        self._readable_text_index[note] = md_info['readable_text']
 
     def get_backlinks(self, note_name: str) -> list[str]:
         """Get backlinks for a note (given its name).
@@ -848,7 +838,7 @@ class Vault:
         if not self._is_connected:
             raise AttributeError('Connect notes before calling the function')
 
-        if note_name not in self._graph.nodes:
+        if note_name not in self._backlinks_index:
             raise ValueError('"{}" not found in graph.'.format(note_name))
         else:
             return self._backlinks_index[note_name]
@@ -866,11 +856,10 @@ class Vault:
         if not self._is_connected:
             raise AttributeError('Connect notes before calling the function')
 
-        if note_name not in self._graph.nodes:
+        if note_name not in self._backlinks_index:
             raise ValueError('"{}" not found in graph.'.format(note_name))
         else:
-            backlinks = self.get_backlinks(note_name)
-            return dict(Counter(backlinks))
+            return dict(Counter(self._backlinks_index[note_name]))
 
     def get_wikilinks(self, file_name: str) -> list[str]:
         """Get wikilinks for a note (given its filename).
@@ -907,7 +896,7 @@ class Vault:
         if not self._is_connected:
             raise AttributeError('Connect notes before calling the function')
 
-        if note_name not in self._graph.nodes:
+        if note_name not in self._backlinks_index:
             raise ValueError('"{}" not found in graph.'.format(note_name))
         else:
             wikilinks = self.get_wikilinks(note_name)
@@ -1089,28 +1078,34 @@ class Vault:
             # keep .canvas ext:
             all_file_names_list = [f.name for f in relpaths_list]
 
-        # get indices of dupe note names:
-        _, inverse_ix, counts = np.unique(
-            np.array(all_file_names_list),
-            return_inverse=True,
-            return_counts=True,
-            axis=0)
-        dupe_names_ix = np.where(counts[inverse_ix] > 1)[0]
+        # get counts of note names, to find the dupes:
+        name_counts = Counter(all_file_names_list)
 
-        # get shortest paths via mask:
-        shortest_paths_arr = np.array(all_file_names_list, dtype=object)
+        # name is the shortest path, unless it's a dupe:
         if extension == 'md':
-            shortest_paths_arr[dupe_names_ix] = np.array(
-                [str(fpath.with_suffix(''))
-                 for fpath in relpaths_list])[dupe_names_ix]
+            dict_out = {(str(fpath.with_suffix(''))
+                         if name_counts[n] > 1 else n): fpath
+                        for n, fpath in zip(all_file_names_list,
+                                            relpaths_list)}
         if extension == 'canvas':
-            shortest_paths_arr[dupe_names_ix] = np.array(
-                [str(fpath)
-                 for fpath in relpaths_list])[dupe_names_ix]
-
-        dict_out = {n: p for n, p in zip(shortest_paths_arr, relpaths_list)}
+            dict_out = {(str(fpath) if name_counts[n] > 1 else n): fpath
+                        for n, fpath in zip(all_file_names_list,
+                                            relpaths_list)}
         return dict_out
 
+    def _get_abspaths_by_name(self,
+                              relpaths_by_name: dict[str, Path]) \
+            -> dict[str, Path]:
+        """Return k,v pairs
+        where k is the file name
+        and v is the absolute path of the file
+
+        Returns:
+            dict
+        """
+        return {n: self._dirpath / relpath
+                for n, relpath in relpaths_by_name.items()}
+
     def _get_md_relpaths_by_name(self, **kwargs) -> dict[str, Path]:
         return self.__get_relpaths_by_name(extension='md',
                                            **kwargs)
@@ -1121,12 +1116,20 @@ class Vault:
 
     @staticmethod
     def _get_backlinks_index(*,
-                             graph: nx.MultiDiGraph) -> dict[str, list[str]]:
+                             graph_data_dict: dict[str, list[str]]) \
+            -> dict[str, list[str]]:
         """Return k,v pairs
         where k is the md note name
-        and v is list of ALL backlinks found in k"""
-        return {n: [n[0] for n in list(graph.in_edges(n))]
-                for n in graph.nodes}
+        and v is list of ALL backlinks found in k
+
+        The graph data dict (that the graph was built from) is inverted in
+        one pass over its links, which gives the nodes in the same order as
+        the graph and the backlinks in the same order as their in-edges."""
+        backlinks_index = {n: [] for n in graph_data_dict}
+        for note, links in graph_data_dict.items():
+            for link in links:
+                backlinks_index.setdefault(link, []).append(note)
+        return backlinks_index
 
     def get_note_metadata(self) -> pd.DataFrame:
         """Structured dataset of metadata on the vault's notes.  This
@@ -1143,16 +1146,17 @@ class Vault:
         if not self._is_connected:
             raise AttributeError('Connect notes before calling the function')
 
-        ix_list = list(set(self._backlinks_index.keys())
-                       .difference(set(self._media_file_index))
-                       .difference(set(self._nonexistent_media_files))
-                       .difference(set(self._canvas_file_index))
-                       )
-
-        df = (pd.DataFrame(index=ix_list,
-                           columns=METADATA_DF_COLS_GENERIC_TYPE)
-              .rename(columns={'file_exists': 'note_exists'})
-              .rename_axis('note'))
+        # notes are the nodes that aren't media or canvas files (in the
+        # order of the graph's nodes):
+        nonexistent_media_files = set(self._nonexistent_media_files)
+        ix_list = [n for n in self._backlinks_index
+                   if n not in self._media_file_index
+                   and n not in nonexistent_media_files
+                   and n not in self._canvas_file_index]
+
+        # (every column is created by the pipe func, in the same order as
+        # METADATA_DF_COLS_GENERIC_TYPE, so no placeholder columns needed)
+        df = pd.DataFrame(index=pd.Index(ix_list, name='note'))
         df = (df.pipe(self._create_note_metadata_columns)
               .pipe(self._clean_up_note_metadata_dtypes)
               )
@@ -1161,44 +1165,43 @@ class Vault:
     def _create_note_metadata_columns(self,
                                       df: pd.DataFrame) -> pd.DataFrame:
         """pipe func for mutating df"""
-        df['rel_filepath'] = [self._md_file_index.get(f, np.NaN)
-                              for f in df.index.tolist()]
-        df['abs_filepath'] = np.where(df['rel_filepath'].notna(),
-                                      [self._dirpath / str(f)
-                                       for f in df['rel_filepath'].tolist()],
-                                      np.NaN)
-        df['note_exists'] = np.where(df['rel_filepath'].notna(),
-                                     True, False)
-        df['n_backlinks'] = [len(self.get_backlinks(f)) for f in df.index]
-        df['n_wikilinks'] = np.where(df['note_exists'],
-                                     [len(self._wikilinks_index.get(f, []))
-                                      for f in df.index.tolist()],
-                                     np.NaN)
-        df['n_tags'] = np.where(df['note_exists'],
-                                [len(self._tags_index.get(f, []))
-                                 for f in df.index.tolist()],
-                                np.NaN)
-        df['n_embedded_files'] = np.where(df['note_exists'],
-                                          [len(self._embedded_files_index.get(
-                                              f, []))
-                                           for f in df.index.tolist()],
-                                          np.NaN)
-        df['modified_time'] = pd.to_datetime(
-            [f.lstat().st_mtime if not pd.isna(f)
-             else pd.NaT
-             for f in df['abs_filepath'].tolist()],
-            unit='s'
-        )
+        # one record per note, in one pass over the indexes
+        # (counts for notes that don't exist will be NaN):
+        records = []
+        modified_times = []
+        for n in df.index:
+            rel_filepath = self._md_file_index.get(n, np.nan)
+            abs_filepath = self._md_file_abspath_index.get(n, np.nan)
+            note_exists = n in self._md_file_index
+            modified_times.append(abs_filepath.lstat().st_mtime_ns
+                                  if note_exists else None)
+            records.append((
+                rel_filepath,
+                abs_filepath,
+                note_exists,
+                # (every note in the index is a key of the backlinks index:)
+                len(self._backlinks_index[n]),
+                len(self._wikilinks_index[n]) if note_exists else np.nan,
+                len(self._tags_index[n]) if note_exists else np.nan,
+                len(self._embedded_files_index[n]) if note_exists else np.nan))
+        df = pd.DataFrame(
+            records, index=df.index,
+            columns=['rel_filepath', 'abs_filepath', 'note_exists',
+                     'n_backlinks', 'n_wikilinks', 'n_tags',
+                     'n_embedded_files'])
+        # (ns ints cast straight to datetimes; None is NaT:)
+        df['modified_time'] = np.array(modified_times,
+                                       dtype='datetime64[ns]')
         return df
 
     def _clean_up_note_metadata_dtypes(self,
                                        df: pd.DataFrame) -> pd.DataFrame:
         """pipe func for mutating df"""
-        df['rel_filepath'] = np.where(df['rel_filepath'].notna(),
-                                      [Path(str(f))
-                                       for f in df['rel_filepath']],
-                                      np.NaN)
-        df['n_wikilinks'] = df['n_wikilinks'].astype(float)  # for consistency
+        # for consistency (counts are int for vaults where all notes exist):
+        count_cols = ['n_wikilinks', 'n_tags', 'n_embedded_files']
+        df[count_cols] = df[count_cols].astype(float)
+        # (a df from no records has object cols, so these are set too:)
+        df = df.astype({'note_exists': bool, 'n_backlinks': 'int64'})
         return df
 
     def get_media_file_metadata(self) -> pd.DataFrame:
@@ -1247,11 +1250,11 @@ class Vault:
             np.logical_not(df.index.isin(self._nonexistent_media_files)),
             index=df.index)
         df['n_backlinks'] = self._get_backlink_counts_for_media_files_only()
-        df['modified_time'] = pd.to_datetime(
-            [f.lstat().st_mtime if not pd.isna(f)
-             else pd.NaT
+        df['modified_time'] = np.array(
+            [f.lstat().st_mtime_ns if not pd.isna(f)
+             else None
              for f in df['abs_filepath'].tolist()],
-            unit='s')
+            dtype='datetime64[ns]')
         return df
 
     def get_canvas_file_metadata(self) -> pd.DataFrame:
@@ -1305,11 +1308,11 @@ class Vault:
                 self._get_backlink_counts_for_canvas_files_only())
         else:
             df['n_backlinks'] = np.NaN
-        df['modified_time'] = pd.to_datetime(
-            [f.lstat().st_mtime if not pd.isna(f)
-             else pd.NaT
+        df['modified_time'] = np.array(
+            [f.lstat().st_mtime_ns if not pd.isna(f)
+             else None
              for f in df['abs_filepath'].tolist()],
-            unit='s')
+            dtype='datetime64[ns]')
         return df
 
     def get_all_file_metadata(self) -> pd.DataFrame:
@@ -1357,20 +1360,24 @@ class Vault:
     def _get_nonexistent_notes(self) -> list[str]:
         """Get notes that have backlinks but don't have md files.
 
-        The comparison is done with sets but the result is returned
-        as a list."""
-        return list(set(self._backlinks_index.keys())
-                    # anything remaining that isn't a file is a non-e note:
-                    .difference(set(self._md_file_index))
-                    .difference(set(self._media_file_index))
-                    .difference(set(self._nonexistent_media_files))
-                    .difference(set(self._canvas_file_index)))
+        The notes are checked in one pass over the backlinks index, so the
+        result is in the order of the graph's nodes."""
+        nonexistent_media_files = set(self._nonexistent_media_files)
+        # anything that isn't a file is a non-e note:
+        return [n for n in self._backlinks_index
+                if n not in self._md_file_index
+                and n not in self._media_file_index
+                and n not in nonexistent_media_files
+                and n not in self._canvas_file_index]
 
     def _get_isolated_notes(self, *,
-                            graph: nx.MultiDiGraph) -> list[str]:
+                            graph_data_dict: dict[str, list[str]]) \
+            -> list[str]:
         """Get notes that are not connected to any other notes in the vault,
         i.e. they have 0 wikilinks and 0 backlinks.
 
-        These notes are retrieved from the graph."""
-        return [fn for fn in nx.isolates(graph)
-                if fn in self._md_file_index]
+        These notes are the isolates of the graph, found from the backlinks
+        index and the graph data dict (in the order of the graph's nodes)."""
+        return [fn for fn, backlinks in self._backlinks_index.items()
+                if not backlinks and not graph_data_dict.get(fn)
+                and fn in self._md_file_index]
@@ -3,18 +3,24 @@ import bleach
 from bs4 import BeautifulSoup
 
 
-def _get_html2text_obj_with_config() -> HTML2Text:
-    """Get HTML2Text object with config set."""
-    txt_maker = HTML2Text()
-
+_HTML2TEXT_CONFIG = {
     # some settings to avoid newline problems with links
-    txt_maker.ignore_links = False
-    txt_maker.body_width = 0
-    txt_maker.protect_links = True
-    txt_maker.wrap_links = False
-
+    'ignore_links': False,
+    'body_width': 0,
+    'protect_links': True,
+    'wrap_links': False,
     # table settings:
-    txt_maker.ignore_tables = True  # keep row content
+    'ignore_tables': True,  # keep row content
+}
+
+
+def _get_html2text_obj_with_config() -> HTML2Text:
+    """Get HTML2Text object with config set.
+
+    A new object is needed for every conversion, as the object holds the
+    state of the conversion, but the config is set in one update."""
+    txt_maker = HTML2Text()
+    txt_maker.__dict__.update(_HTML2TEXT_CONFIG)
     return txt_maker
 
 
@@ -1,5 +1,7 @@
 import re
+import threading
 import yaml
+from functools import partial
 from pathlib import Path
 from bs4 import BeautifulSoup
 import markdown
@@ -11,7 +13,8 @@ from ._constants import (WIKILINK_REGEX,
                          INLINE_LINK_AFTER_HTML_PROC_REGEX,
                          INLINE_LINK_VIA_MD_ONLY_REGEX)
 from ._io import (get_relpaths_from_dir,
-                  get_relpaths_matching_subdirs)
+                  get_relpaths_matching_subdirs,
+                  _map_over_md_files)
 from .html_processing import (_get_plaintext_from_html,
                               _remove_code_via_soup,
                               _remove_latex_via_soup,
@@ -19,6 +22,54 @@ from .html_processing import (_get_plaintext_from_html,
                               _remove_main_formatting,
                               _get_all_latex_from_html_content)
 
+# md syntax that can change wikilinks on the way through the
+# md -> HTML -> plaintext steps (code, HTML, entities, escapes, math,
+# strikethrough, highlights, md links, footnotes & reference definitions),
+# or lines that markdown reinterprets: table delimiter rows & wikilinks that
+# could be in indented code:
+_NON_PLAIN_MD_CHARS = frozenset('`~<&\\$')
+_NON_PLAIN_MD_STRINGS = ('](', '[^', '==', ']:')
+_NON_PLAIN_MD_LINE_PATTERN = re.compile(
+    r'^[ \t>]*\|?[ \t]*:?-+:?[ \t]*\|'
+    r'|^[ \t>]*[|:\- \t]*\|[|:\- \t]*$'
+    r'|^.*(?: {4}|\t).*\[\[',
+    re.MULTILINE)
+# (and inside a wikilink: emphasis, '>' as an HTML entity, or whitespace
+# that isn't one space)
+_NON_PLAIN_WIKILINK_CHARS = frozenset('*_=>\t\xa0')
+# md syntax that a link needs in a file to come out of the same steps in
+# the [...](<...>) format (inline links & images, reference definitions, HTML
+# & autolinks, entities):
+_MD_LINK_SOURCE_STRINGS = ('](', ']:', '<', '&')
+
+# compiled once, as the regexes are run on every note in a vault:
+_WIKILINK_PATTERN = re.compile(WIKILINK_REGEX)
+_TAG_MAIN_ONLY_PATTERN = re.compile(TAG_MAIN_ONLY_REGEX)
+_TAG_INCLUDE_NESTED_PATTERN = re.compile(TAG_INCLUDE_NESTED_REGEX)
+_INLINE_LINK_AFTER_HTML_PROC_PATTERN = re.compile(
+    INLINE_LINK_AFTER_HTML_PROC_REGEX)
+_INLINE_LINK_VIA_MD_ONLY_PATTERN = re.compile(INLINE_LINK_VIA_MD_ONLY_REGEX)
+_WIKILINK_AS_STRING_PATTERN = re.compile(WIKILINK_AS_STRING_REGEX)
+_EMBEDDED_FILE_LINK_AS_STRING_PATTERN = re.compile(
+    EMBEDDED_FILE_LINK_AS_STRING_REGEX)
+
+_MARKDOWN_CONFIG = {
+    'output_format': 'html',
+    'extensions': ['pymdownx.arithmatex',
+                   'pymdownx.superfences',
+                   'pymdownx.mark',
+                   'pymdownx.tilde',
+                   'pymdownx.saneheaders',
+                   'footnotes',
+                   'sane_lists',
+                   'tables'],
+    'extension_configs': {'pymdownx.tilde': {'subscript': False}}}
+# the '---' lines around YAML front matter:
+_YAML_FRONT_MATTER_BOUNDARY_PATTERN = frontmatter.YAMLHandler.FM_BOUNDARY
+
+# a Markdown object per thread, as it holds the state of a conversion:
+_MARKDOWN_LOCAL = threading.local()
+
 
 def get_md_relpaths_from_dir(dir_path: Path) -> list[Path]:
     """Get list of relative paths for markdown files in a given directory,
@@ -96,7 +147,7 @@ def get_wikilinks(filepath: Path, *,
     Returns:
         list of strings
     """
-    src_txt = get_source_text_from_md_file(filepath, remove_code=True)
+    src_txt = _get_source_text_for_wikilinks(filepath)
 
     wikilinks = _get_all_wikilinks_from_source_text(
         src_txt, remove_aliases=True,
@@ -104,6 +155,38 @@ def get_wikilinks(filepath: Path, *,
     return wikilinks
 
 
+def _get_wikilinks_bulk(filepaths: list[Path], *,
+                        exclude_canvas: bool = True,
+                        max_workers: int = 1) -> dict[Path, list[str]]:
+    """Get ALL wikilinks from each md file in a list, as a dict where
+    k is the filepath and v is the list of wikilinks from get_wikilinks.
+
+    The md files can be read in parallel across worker processes, through
+    the max_workers arg.  On platforms where these are spawned (e.g.
+    Windows, macOS), call this function from code under an
+    if __name__ == '__main__' block when doing so.
+
+    Args:
+        filepaths (list of pathlib Path): Path objects representing the files
+            from which info will be extracted.
+        exclude_canvas (bool): Defaults to True. Exclude canvas files from
+            the list of wikilinks.
+        max_workers (int, optional): Defaults to 1, so the md files are
+            read one at a time in the current process.  Set this to a
+            higher number to read md files in parallel across that many
+            worker processes, or None to use all the CPUs on the machine.
+            A list of only a few md files is always read in the current
+            process.
+
+    Returns:
+        dict of lists of strings
+    """
+    wikilinks_list = _map_over_md_files(
+        partial(get_wikilinks, exclude_canvas=exclude_canvas),
+        filepaths, max_workers=max_workers)
+    return dict(zip(filepaths, wikilinks_list))
+
+
 def get_embedded_files(filepath: Path) -> list[str]:
     """Get ALL embedded files from a md file.
     The embedded files' order of appearance in the file IS preserved in the output.
@@ -121,7 +204,7 @@ def get_embedded_files(filepath: Path) -> list[str]:
     Returns:
         list of strings
     """
-    src_txt = get_source_text_from_md_file(filepath, remove_code=True)
+    src_txt = _get_source_text_for_wikilinks(filepath)
 
     files = _get_all_embedded_files_from_source_text(
         src_txt, remove_aliases=True)
@@ -148,7 +231,7 @@ def get_unique_wikilinks(filepath: Path, *,
     Returns:
         list of strings
     """
-    src_txt = get_source_text_from_md_file(filepath, remove_code=True)
+    src_txt = _get_source_text_for_wikilinks(filepath)
 
     wikilinks = _get_unique_wikilinks_from_source_text(
         src_txt, remove_aliases=True,
@@ -171,7 +254,7 @@ def get_md_links(filepath: Path) -> list[str]:
     Returns:
         list of strings
     """
-    src_txt = get_source_text_from_md_file(filepath, remove_code=True)
+    src_txt = _get_source_text_for_md_links(filepath)
     return _get_md_links_from_source_text(src_txt)
 
 
@@ -198,7 +281,7 @@ def get_unique_md_links(filepath: Path) -> list[str]:
     Returns:
         list of strings
     """
-    src_txt = get_source_text_from_md_file(filepath, remove_code=True)
+    src_txt = _get_source_text_for_md_links(filepath)
 
     links = _get_unique_md_links_from_source_text(src_txt)
     return links
@@ -215,10 +298,38 @@ def get_front_matter(filepath: Path) -> dict:
     Returns:
         dict
     """
-    front_matter, _ = _get_md_front_matter_and_content(filepath)
+    front_matter, _ = _parse_md_front_matter_and_content(
+        _read_md_file_string_for_front_matter(filepath),
+        filepath=filepath)
     return front_matter
 
 
+def _read_md_file_string_for_front_matter(filepath: Path) -> str:
+    """Read the start of a md file, up to the end of its YAML front matter.
+
+    The rest of the file isn't needed to parse the front matter, so it is
+    only read for a file that might have front matter in another format
+    (e.g. JSON, TOML) or that has no closing '---' line.  For a file without
+    front matter, the string is empty."""
+    lines = []
+    with open(filepath, encoding='utf-8') as f:
+        for line in f:
+            lines.append(line)
+            if len(lines) == 1 and not line.strip():
+                lines.pop()  # (front matter starts after any blank lines)
+            elif len(lines) == 1:
+                if _YAML_FRONT_MATTER_BOUNDARY_PATTERN.match(line.lstrip()):
+                    continue
+                if not any(handler.detect(line.lstrip())
+                           for handler in frontmatter.handlers):
+                    return ''
+                lines.append(f.read())
+                break
+            elif _YAML_FRONT_MATTER_BOUNDARY_PATTERN.match(line):
+                break
+    return ''.join(lines)
+
+
 def get_tags(filepath: Path, *, show_nested: bool = False) -> list[str]:
     """Get tags from a md file, based on the order they appear in the file.
     By default, only the highest level of any nested tags is shown in the
@@ -235,41 +346,128 @@ def get_tags(filepath: Path, *, show_nested: bool = False) -> list[str]:
     Returns:
         list
     """
+    with open(filepath, encoding='utf-8') as f:
+        file_string = f.read()
+    return _get_tags_from_md_file_string(file_string, filepath=filepath,
+                                         show_nested=show_nested)
+
+
+def _get_tags_from_md_file_string(file_string: str, *, filepath: Path,
+                                  show_nested: bool = False) -> list[str]:
     # get text from source file, but remove any '\#' and code:
-    src_txt = get_source_text_from_md_file(
-        filepath, remove_code=True,
-        str_transform_func=_transform_md_file_string_for_tag_parsing)
+    _, md_content = _parse_md_front_matter_and_content(
+        _transform_md_file_string_for_tag_parsing(file_string),
+        filepath=filepath)
+    src_txt = get_source_text_from_html(
+        _get_html_from_md_content(md_content), remove_code=True)
+    return _get_tags_from_source_text_with_wikilinks(src_txt,
+                                                    show_nested=show_nested)
+
+
+def _get_tags_from_source_text_with_wikilinks(src_txt: str, *,
+                                              show_nested: bool = False) -> list[str]:
     # remove wikilinks so that '#' headers are not caught:
     src_txt = _remove_wikilinks_from_source_text(src_txt)
-    tags = _get_tags_from_source_text(src_txt, show_nested=show_nested)
-    return tags
+    return _get_tags_from_source_text(src_txt, show_nested=show_nested)
+
+
+def _get_connect_info_from_md_file(filepath: Path, *,
+                                   show_nested_tags: bool = False,
+                                   exclude_canvas: bool = True) -> dict:
+    """Get all the info from a md file that the Vault connect method needs,
+    as a dict of {index name: value}.
+
+    This is a module-level function so that it can be sent to worker
+    processes when the md files are read in parallel."""
+    # MAIN file read:
+    with open(filepath, encoding='utf-8') as f:
+        file_string = f.read()
+    front_matter, content = _parse_md_front_matter_and_content(
+        file_string, filepath=filepath)
+    html = _get_html_from_md_content(content)
+    src_txt = get_source_text_from_html(
+        html, remove_code=True)
+    # the tags are parsed from the same source text, unless the file has
+    # any '\#' to remove first:
+    if '\\#' in file_string:
+        tags = _get_tags_from_md_file_string(
+            file_string, filepath=filepath, show_nested=show_nested_tags)
+    else:
+        tags = _get_tags_from_source_text_with_wikilinks(
+            src_txt, show_nested=show_nested_tags)
+    # the unique links are taken from the full lists of links, so that the
+    # source text is only scanned once for each type of link:
+    md_links = _get_md_links_from_source_text(src_txt)
+    # (aliases are redundant for connect method)
+    wikilinks, embedded_files = (
+        _get_wikilinks_and_embedded_files_from_source_text(
+            src_txt, exclude_canvas=exclude_canvas))
+
+    return {
+        # info from core text:
+        'md_links': md_links,
+        'unique_md_links': list(dict.fromkeys(md_links)),
+        'embedded_files': embedded_files,
+        'wikilinks': wikilinks,
+        'unique_wikilinks': list(dict.fromkeys(wikilinks)),
+        # info from html:
+        'math': _get_all_latex_from_html_content(html),
+        # split out front matter:
+        'front_matter': front_matter,
+        'tags': tags}
+
+
+def _get_gather_info_from_md_file(filepath: Path, *,
+                                  tags: list[str] = None) -> dict:
+    """Get all the text from a md file that the Vault gather method needs,
+    as a dict of {index name: value}.
+
+    This is a module-level function so that it can be sent to worker
+    processes when the md files are read in parallel."""
+    # MAIN file read:
+    _, content = _get_md_front_matter_and_content(filepath)
+    html = _get_html_from_md_content(content)
+
+    return {
+        # 'source' text will not remove any content, but 'readable' will
+        # (also remove LaTeX for source text:)
+        'source_text': get_source_text_from_html(
+            html, remove_code=True, remove_math=True),
+        'readable_text': _get_readable_text_from_html(html, tags=tags)}
 
 
 def _get_md_front_matter_and_content(filepath: Path, *,
                                      str_transform_func=None) -> tuple[dict, str]:
     """parse md file into front matter and note content"""
     with open(filepath, encoding='utf-8') as f:
-        try:
-            file_string = f.read()
-            if str_transform_func:
-                file_string = str_transform_func(file_string)
-            return frontmatter.parse(file_string)
-        # for invalid YAML, return the whole file as content:
-        except yaml.scanner.ScannerError as e:
-            print(f"Front matter not populated for {filepath.name}: {repr(e)}")
-            return {}, file_string
-        except yaml.parser.ParserError as e:
-            print(f"Front matter not populated for {filepath.name}: {repr(e)}")
-            return {}, file_string
-        # handle template {{}} chars in front matter:
-        except yaml.constructor.ConstructorError:
-            file_string_esc = file_string.translate(
-                str.maketrans({"{": r"\{",
-                               "}": r"\}"}))
-            return frontmatter.parse(file_string_esc)
-        # any others:
-        except:
-            return {}, file_string
+        file_string = f.read()
+    if str_transform_func:
+        file_string = str_transform_func(file_string)
+    return _parse_md_front_matter_and_content(file_string,
+                                              filepath=filepath)
+
+
+def _parse_md_front_matter_and_content(file_string: str, *,
+                                       filepath: Path) -> tuple[dict, str]:
+    """parse md file string into front matter and note content"""
+    try:
+        return frontmatter.parse(file_string)
+    # for invalid YAML, return the whole file as content:
+    except yaml.scanner.ScannerError as e:
+        print(f"Front matter not populated for {filepath.name}: {repr(e)}")
+        return {}, file_string
+    except yaml.parser.ParserError as e:
+        print(f"Front matter not populated for {filepath.name}: {repr(e)}")
+        return {}, file_string
+    # handle template {{}} chars in front matter:
+    except yaml.constructor.ConstructorError:
+        file_string_esc = file_string.translate(
+            str.maketrans({"{": r"\{",
+                           "}": r"\}"}))
+        return frontmatter.parse(file_string_esc)
+    # any others:
+    except:
+        return {}, file_string
 
 
 def _get_html_from_md_file(filepath: Path, *,
@@ -289,18 +487,23 @@ def _get_html_from_md_file(filepath: Path, *,
 
 def _get_html_from_md_content(md_content: str) -> str:
     """md content -> html (without front matter)"""
-    html = markdown.markdown(md_content, output_format='html',
-                             extensions=['pymdownx.arithmatex',
-                                         'pymdownx.superfences',
-                                         'pymdownx.mark',
-                                         'pymdownx.tilde',
-                                         'pymdownx.saneheaders',
-                                         'footnotes',
-                                         'sane_lists',
-                                         'tables'],
-                             extension_configs={'pymdownx.tilde':
-                                                {'subscript': False}})
-    return html
+    md = _get_markdown_obj()
+    try:
+        return md.convert(md_content)
+    finally:
+        md.reset()
+
+
+def _get_markdown_obj() -> markdown.Markdown:
+    """Get Markdown object with config set, for the current thread.
+
+    The object is created once (which is where most of the cost of setting
+    up the extensions is), then reset after each conversion."""
+    md = getattr(_MARKDOWN_LOCAL, 'md', None)
+    if md is None:
+        md = markdown.Markdown(**_MARKDOWN_CONFIG)
+        _MARKDOWN_LOCAL.md = md
+    return md
 
 
 def get_source_text_from_html(html: str, *,
@@ -330,6 +533,64 @@ def get_source_text_from_md_file(filepath: Path, *,
                                      remove_math=remove_math)
 
 
+def _get_source_text_for_wikilinks(filepath: Path) -> str:
+    """md file -> source text (without code), for wikilink and embedded file
+    extraction.
+
+    Wikilinks pass through the markdown -> HTML -> plaintext steps as-is, so
+    a note without '[[' in its file can only get them from entities (e.g.
+    '&#91;&#91;'), which the steps decode: the front matter parse and the
+    expensive steps are all skipped for a note without either.  The
+    expensive steps are also skipped for a note with only plain md around
+    its wikilinks, as its md content gives the same wikilinks as its
+    source text."""
+    with open(filepath, encoding='utf-8') as f:
+        file_string = f.read()
+    if '[[' not in file_string and '&' not in file_string:
+        return ''
+    _, md_content = _parse_md_front_matter_and_content(file_string,
+                                                       filepath=filepath)
+    if _has_only_plain_md_around_wikilinks(md_content):
+        return md_content
+    html = _get_html_from_md_content(md_content)
+    return get_source_text_from_html(html, remove_code=True)
+
+
+def _get_source_text_for_md_links(filepath: Path) -> str:
+    """md file -> source text (without code), for md link extraction.
+
+    An md link can only be in the source text if its file has syntax that
+    becomes a link in the HTML, so the front matter parse and the expensive
+    steps are all skipped for a note without any of that syntax."""
+    with open(filepath, encoding='utf-8') as f:
+        file_string = f.read()
+    if not any(i in file_string for i in _MD_LINK_SOURCE_STRINGS):
+        return ''
+    _, md_content = _parse_md_front_matter_and_content(file_string,
+                                                       filepath=filepath)
+    html = _get_html_from_md_content(md_content)
+    return get_source_text_from_html(html, remove_code=True)
+
+
+def _has_only_plain_md_around_wikilinks(md_content: str) -> bool:
+    """Check if the wikilinks in md content would come out of the
+    md -> HTML -> plaintext steps unchanged (and in the same order)."""
+    if (not _NON_PLAIN_MD_CHARS.isdisjoint(md_content)
+            or any(i in md_content for i in _NON_PLAIN_MD_STRINGS)
+            or _NON_PLAIN_MD_LINE_PATTERN.search(md_content)):
+        return False
+    n_links = 0
+    for m in _WIKILINK_PATTERN.finditer(md_content):
+        link = m.group(2)
+        if (not _NON_PLAIN_WIKILINK_CHARS.isdisjoint(link)
+                or '  ' in link):
+            return False
+        n_links += 1
+    # (a '[[' outside of a wikilink could become one after the steps,
+    # e.g. if it's closed on the next line of a paragraph)
+    return n_links == md_content.count('[[')
+
+
 def get_readable_text_from_md_file(filepath: Path, *,
                                    tags: list[str] = None) -> str:
     """md file -> html -> plaintext with major formatting removed."""
@@ -365,51 +626,70 @@ def _get_readable_text_from_html(html: str, *,
     return _get_plaintext_from_html(new_str)
 
 
-def _get_all_wikilinks_and_embedded_files(src_txt: str) -> list[str]:
-    # extract links
-    pattern = re.compile(WIKILINK_REGEX)
-
-    link_matches_list = pattern.findall(src_txt)
-    return link_matches_list
-
-
-def _remove_aliases_from_wikilink_regex_matches(link_matches_list: list[str]) -> list[str]:
-    return [(i.replace('\\', '')
-             .split("|")[0].rstrip()  # catch alias/alt-text
-             .split('#', 1)[0])  # catch links to headers
-            for i in link_matches_list]
+def _remove_alias_from_wikilink_regex_match(link_match: str) -> str:
+    return (link_match.replace('\\', '')
+            .partition("|")[0].rstrip()  # catch alias/alt-text
+            .partition('#')[0])  # catch links to headers
 
 
 def _get_all_wikilinks_from_source_text(src_txt: str, *,
                                         remove_aliases: bool = True,
                                         exclude_canvas: bool = True) -> list[str]:
-    matches_list = _get_all_wikilinks_and_embedded_files(src_txt)
-    link_matches_list = [g[1] for g in matches_list
-                         if g[0] == '']
-
+    if '[[' not in src_txt:  # no wikilinks to find
+        return []
+    # (wikilinks are the matches without the '!' group; the matches are
+    # cleaned up in comprehensions over the findall tuples, as that's
+    # quicker than a loop over match objects)
+    return _clean_up_wikilinks(
+        [link for embed, link in _WIKILINK_PATTERN.findall(src_txt)
+         if not embed],
+        remove_aliases=remove_aliases, exclude_canvas=exclude_canvas)
+
+
+def _clean_up_wikilinks(links: list[str], *,
+                        remove_aliases: bool = True,
+                        exclude_canvas: bool = True) -> list[str]:
     if remove_aliases:
-        link_matches_list = _remove_aliases_from_wikilink_regex_matches(
-            link_matches_list)
-
-    # remove .md:
-    link_matches_list = [name.removesuffix('.md')
-                         for name in link_matches_list]
+        links = [_remove_alias_from_wikilink_regex_match(link)
+                 .removesuffix('.md')
+                 for link in links]
+    else:
+        links = [link.removesuffix('.md') for link in links]
     if exclude_canvas:
-        link_matches_list = [n for n in link_matches_list
-                             if not n.endswith('.canvas')]
-    return link_matches_list
+        links = [link for link in links if not link.endswith('.canvas')]
+    return links
 
 
 def _get_all_embedded_files_from_source_text(src_txt: str, *,
                                              remove_aliases: bool = True) -> list[str]:
-    matches_list = _get_all_wikilinks_and_embedded_files(src_txt)
-    embedded_files_sublist = [g[1] for g in matches_list
-                              if g[0] == '!']
-
+    if '![[' not in src_txt:  # no embedded files to find
+        return []
+    # (embedded files are the matches with the '!' group)
+    embedded_files = [link
+                      for embed, link in _WIKILINK_PATTERN.findall(src_txt)
+                      if embed]
     if remove_aliases:
-        embedded_files_sublist = _remove_aliases_from_wikilink_regex_matches(
-            embedded_files_sublist)
-    return embedded_files_sublist
+        embedded_files = [_remove_alias_from_wikilink_regex_match(link)
+                          for link in embedded_files]
+    return embedded_files
+
+
+def _get_wikilinks_and_embedded_files_from_source_text(
+        src_txt: str, *,
+        exclude_canvas: bool = True) -> tuple[list[str], list[str]]:
+    """Get (wikilinks, embedded files) from one pass of the regex over the
+    text, with aliases removed.  This gives the same output as the
+    _get_all_wikilinks_from_source_text &
+    _get_all_embedded_files_from_source_text funcs."""
+    if '[[' not in src_txt:  # no wikilinks or embedded files to find
+        return [], []
+    matches = _WIKILINK_PATTERN.findall(src_txt)
+    wikilinks = _clean_up_wikilinks(
+        [link for embed, link in matches if not embed],
+        exclude_canvas=exclude_canvas)
+    embedded_files = [_remove_alias_from_wikilink_regex_match(link)
+                      for embed, link in matches if embed]
+    return wikilinks, embedded_files
 
 
 def _get_all_latex_from_md_file(filepath: Path) -> list[str]:
@@ -420,28 +700,25 @@ def _get_all_latex_from_md_file(filepath: Path) -> list[str]:
 def _get_unique_wikilinks_from_source_text(src_txt: str, *,
                                            remove_aliases: bool = True,
                                            exclude_canvas: bool = True) -> list[str]:
-    wikilinks = _get_all_wikilinks_from_source_text(
+    return list(dict.fromkeys(_get_all_wikilinks_from_source_text(
         src_txt, remove_aliases=remove_aliases,
-        exclude_canvas=exclude_canvas)
-    return list(dict.fromkeys(wikilinks))
+        exclude_canvas=exclude_canvas)))
 
 
 def _get_all_md_link_info_from_source_text(src_txt: str) -> list[tuple[str]]:
-    links_regex = re.compile(INLINE_LINK_AFTER_HTML_PROC_REGEX)
-
-    links_list_of_tuples = list(links_regex.findall(src_txt))
-    return links_list_of_tuples
+    if '](<' not in src_txt:  # no md links to find
+        return []
+    return _INLINE_LINK_AFTER_HTML_PROC_PATTERN.findall(src_txt)
 
 
 def _get_unique_md_links_from_source_text(src_txt: str) -> list[str]:
     links_detail = _get_all_md_link_info_from_source_text(
         src_txt)
-    links_list = [link for _, link in links_detail]
-    return list(dict.fromkeys(links_list))
+    return list(dict.fromkeys(link for _, link in links_detail))
 
 
 def _remove_wikilinks_from_source_text(src_txt: str) -> str:
-    return re.sub(WIKILINK_REGEX, '', src_txt)
+    return _WIKILINK_PATTERN.sub('', src_txt)
 
 
 def _transform_md_file_string_for_tag_parsing(txt: str) -> str:
@@ -451,14 +728,16 @@ def _transform_md_file_string_for_tag_parsing(txt: str) -> str:
 def _get_tags_from_source_text(src_txt: str, *,
                                show_nested: bool = False) -> list[str]:
     if not show_nested:
-        pattern = re.compile(TAG_MAIN_ONLY_REGEX)
+        pattern = _TAG_MAIN_ONLY_PATTERN
     else:
-        pattern = re.compile(TAG_INCLUDE_NESTED_REGEX)
+        pattern = _TAG_INCLUDE_NESTED_PATTERN
     tags_list = pattern.findall(src_txt)
     return tags_list
 
 
 def _replace_wikilinks_with_their_text(src_txt: str) -> str:
+    if '[[' not in src_txt:  # no wikilinks to replace
+        return src_txt
     # get list of wikilinks as strings:
     links_list = _get_all_wikilinks_from_source_text(
         src_txt, remove_aliases=False)
@@ -481,10 +760,12 @@ def _replace_wikilinks_with_their_text(src_txt: str) -> str:
 
 
 def _replace_md_links_with_their_text(src_txt: str) -> str:
+    if '](' not in src_txt:  # no md links to replace
+        return src_txt
     # get list of wikilinks as strings:
-    matched_text_list = re.findall(WIKILINK_AS_STRING_REGEX, src_txt)
+    matched_text_list = _WIKILINK_AS_STRING_PATTERN.findall(src_txt)
     # get the detail from groups:
-    links_detail = re.findall(INLINE_LINK_VIA_MD_ONLY_REGEX, src_txt)
+    links_detail = _INLINE_LINK_VIA_MD_ONLY_PATTERN.findall(src_txt)
 
     # get links in their text format:
     readable_text_list = [text for text, _ in links_detail]
@@ -499,8 +780,11 @@ def _replace_md_links_with_their_text(src_txt: str) -> str:
 
 
 def _remove_embedded_file_links_from_text(src_txt: str) -> str:
+    if '[[' not in src_txt:  # no embedded files to remove
+        return src_txt
     # get list of embedded file links as strings:
-    links_list = re.findall(EMBEDDED_FILE_LINK_AS_STRING_REGEX, src_txt)
+    links_list = _EMBEDDED_FILE_LINK_AS_STRING_PATTERN.findall(
+        src_txt)
     # add in the ![[...]] chars:
     links_list = ["".join(['![[', i, ']]']) for i in links_list]
 
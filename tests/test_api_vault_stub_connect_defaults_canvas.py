@@ -36,6 +36,15 @@ def test_canvas_content_index(actual_connected_vault):
     assert actual_crazy_wall_2_text == expected_crazy_wall_2_text
 
 
+def test_canvas_graph_detail_index_built_on_access(actual_connected_vault):
+    assert actual_connected_vault._canvas_graph_detail_index is None
+
+    actual_index = actual_connected_vault.canvas_graph_detail_index
+    assert list(actual_index) == list(
+        actual_connected_vault.canvas_content_index)
+    assert actual_connected_vault.canvas_graph_detail_index is actual_index
+
+
 def test_canvas_graph_detail_index_graph(actual_connected_vault):
     actual_crazy_wall_graph_detail = (
         actual_connected_vault.canvas_graph_detail_index
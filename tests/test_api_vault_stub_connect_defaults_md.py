@@ -525,6 +525,20 @@ def test_embedded_files_sussudio(actual_connected_vault):
     assert actual_files == expected_files
 
 
+def test_connect_with_worker_processes(actual_connected_vault):
+    actual_vault_w_workers = (Vault(WKD / 'tests/vault-stub')
+                              .connect(max_workers=2))
+
+    assert (actual_vault_w_workers.wikilinks_index
+            == actual_connected_vault.wikilinks_index)
+    assert (actual_vault_w_workers.front_matter_index
+            == actual_connected_vault.front_matter_index)
+    assert (actual_vault_w_workers.tags_index
+            == actual_connected_vault.tags_index)
+    assert (actual_vault_w_workers.backlinks_index
+            == actual_connected_vault.backlinks_index)
+
+
 def test_nodes_gte_files(actual_connected_vault):
     act_f_len = len(actual_connected_vault.md_file_index)
     act_n_len = len(actual_connected_vault.wikilinks_index)
@@ -109,3 +109,14 @@ However these shouldn't be recognised as tags: \- (#y1985 ) \- #1985 \- American
 """
     actual_text = actual_gathered_vault_defaults.get_readable_text('Sussudio')
     assert actual_text == expected_text
+
+
+def test_gather_with_worker_processes(actual_gathered_vault_defaults):
+    actual_vault_w_workers = (Vault(WKD / 'tests/vault-stub')
+                              .connect()
+                              .gather(max_workers=2))
+
+    assert (actual_vault_w_workers.source_text_index
+            == actual_gathered_vault_defaults.source_text_index)
+    assert (actual_vault_w_workers.readable_text_index
+            == actual_gathered_vault_defaults.readable_text_index)
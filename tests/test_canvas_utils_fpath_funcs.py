@@ -2,7 +2,8 @@ from pathlib import Path
 import pytest
 
 
-from obsidiantools.canvas_utils import (get_canvas_relpaths_from_dir)
+from obsidiantools.canvas_utils import (get_canvas_relpaths_from_dir,
+                                        _get_all_valid_canvas_file_relpaths)
 
 
 @pytest.fixture
@@ -20,3 +21,29 @@ def test_get_canvas_relpaths_from_dir(tmp_path):
     for p in actual_relpaths:
         assert isinstance(p, Path)
         assert p.suffix == 'canvas'
+
+
+def test_get_all_valid_canvas_file_relpaths_nested(tmp_path):
+    (tmp_path / 'sub' / 'subsub').mkdir(parents=True)
+    (tmp_path / '.hidden').mkdir()
+    for p in ['root.canvas', 'sub/a.CANVAS', 'sub/subsub/b.canvas',
+              'sub/c.md', '.hidden/d.canvas']:
+        (tmp_path / p).write_text('')
+
+    # (same as a glob of all the files in the dir, which includes hidden
+    # files & dirs)
+    actual_relpaths = _get_all_valid_canvas_file_relpaths(tmp_path)
+    expected_relpaths = [p.relative_to(tmp_path)
+                         for p in tmp_path.glob('**/*')
+                         if p.suffix in {'.canvas', '.CANVAS'}]
+    assert actual_relpaths == expected_relpaths
+    assert len(actual_relpaths) == 4
+
+
+def test_get_all_valid_canvas_file_relpaths_any_case(tmp_path):
+    for p in ['a.canvas', 'b.CANVAS', 'c.Canvas', 'd.canvas.md']:
+        (tmp_path / p).write_text('')
+
+    actual_relpaths = _get_all_valid_canvas_file_relpaths(tmp_path)
+    assert sorted(actual_relpaths) == [
+        Path('a.canvas'), Path('b.CANVAS'), Path('c.Canvas')]
@@ -2,7 +2,8 @@ from pathlib import Path
 
 from obsidiantools.html_processing import (_remove_code,
                                            _remove_del_text,
-                                           _remove_latex)
+                                           _remove_latex,
+                                           _get_html2text_obj_with_config)
 from obsidiantools.md_utils import _get_html_from_md_file
 
 # NOTE: run the tests from the project dir.
@@ -52,3 +53,15 @@ def test_remove_latex_in_note_with_highly_formatted_text():
 </p>
 <p>Taking the expectation of the equation system in  <em>...</em></p></body></html>"""
     assert actual_html_string == expected_html_string
+
+
+def test_html2text_obj_config():
+    txt_maker = _get_html2text_obj_with_config()
+
+    assert not txt_maker.ignore_links
+    assert txt_maker.body_width == 0
+    assert txt_maker.protect_links
+    assert not txt_maker.wrap_links
+    assert txt_maker.ignore_tables
+    # a new object for each conversion:
+    assert _get_html2text_obj_with_config() is not txt_maker
@@ -3,11 +3,15 @@ from pathlib import Path
 
 from obsidiantools.md_utils import (_get_all_wikilinks_from_source_text,
                                     _get_all_embedded_files_from_source_text,
+                                    _get_wikilinks_and_embedded_files_from_source_text,
                                     _get_unique_wikilinks_from_source_text,
                                     _get_all_md_link_info_from_source_text,
                                     _get_unique_md_links_from_source_text,
+                                    _get_tags_from_source_text,
+                                    get_md_links,
                                     get_unique_md_links,
                                     _get_html_from_md_file,
+                                    _get_html_from_md_content,
                                     get_source_text_from_md_file,
                                     _transform_md_file_string_for_tag_parsing,
                                     get_wikilinks,
@@ -17,7 +21,8 @@ from obsidiantools.md_utils import (_get_all_wikilinks_from_source_text,
                                     _remove_wikilinks_from_source_text,
                                     _replace_wikilinks_with_their_text,
                                     _replace_md_links_with_their_text,
-                                    get_readable_text_from_md_file)
+                                    get_readable_text_from_md_file,
+                                    _has_only_plain_md_around_wikilinks)
 from obsidiantools.html_processing import (_get_all_latex_from_html_content)
 
 
@@ -134,6 +139,17 @@ def test_get_all_embedded_files_from_source_text_keep_aliases(
     assert actual_results == expected_results
 
 
+def test_get_wikilinks_and_embedded_files_from_source_text(
+        html_wikilinks_stub):
+    actual_results = _get_wikilinks_and_embedded_files_from_source_text(
+        html_wikilinks_stub)
+    expected_results = (
+        _get_all_wikilinks_from_source_text(html_wikilinks_stub),
+        _get_all_embedded_files_from_source_text(html_wikilinks_stub))
+
+    assert actual_results == expected_results
+
+
 def test_get_unique_wikilinks_from_html_content(html_wikilinks_stub):
     actual_results = _get_unique_wikilinks_from_source_text(
         html_wikilinks_stub, remove_aliases=True)
@@ -153,6 +169,16 @@ def test_get_unique_wikilinks_from_html_content_has_unique_links(html_wikilinks_
     assert len(set(actual_links)) == len(actual_links)
 
 
+def test_wikilinks_aliases_and_headers_removed():
+    src_txt = r'[[A#Header|alias]] [[B\|table alias]] [[C | x | y]] [[D#E#F]]'
+    assert _get_all_wikilinks_from_source_text(src_txt) == ['A', 'B', 'C', 'D']
+
+
+def test_wikilinks_malformed_brackets():
+    src_txt = '[[a[b]] [[x[[c]] [[d\ne]] [[ ' * 3
+    assert _get_all_wikilinks_from_source_text(src_txt) == ['a[b', 'c'] * 3
+
+
 def test_get_all_md_link_info(txt_md_links_stub):
     expected_links = [('The Times 03/Jan/2009 Chancellor on brink of second bailout for banks',
                        'https://www.thetimes.co.uk/article/chancellor-alistair-darling-on-brink-of-second-bailout-for-banks-n9l382mn62h'),
@@ -260,6 +286,14 @@ def test_sussudio_tags_with_nesting_shown():
     assert actual_tags == expected_tags
 
 
+def test_nested_tags_before_unmatched_closing_brackets():
+    # a stray ']]' later in the text doesn't hide nested tags:
+    src_txt = '#y1982/sep and #y2000/party-over then ]] at the end'
+    actual_tags = _get_tags_from_source_text(src_txt, show_nested=True)
+    expected_tags = ['y1982/sep', 'y2000/party-over']
+    assert actual_tags == expected_tags
+
+
 def test_embedded_files_alias_scaling():
     actual_embedded_images = get_embedded_files(
         Path('.') / 'tests/general/embedded-images_in-table.md')
@@ -277,6 +311,57 @@ def test_wikilinks_code_block():
     assert actual_links == expected_links
 
 
+def test_wikilinks_file_without_wikilinks():
+    actual_links = get_wikilinks(
+        Path('.') / 'tests/general/md-links_extraction.md')
+    assert actual_links == []
+
+    actual_files = get_embedded_files(
+        Path('.') / 'tests/general/md-links_extraction.md')
+    assert actual_files == []
+
+
+def test_wikilinks_file_with_wikilinks():
+    actual_links = get_wikilinks(
+        Path('.') / 'tests/general/wikilinks_extraction.md')
+    expected_links = ['A', 'B', 'C', 'D', 'E', 'A']
+    assert actual_links == expected_links
+
+
+def test_wikilinks_from_entities(tmp_path):
+    entities_file = tmp_path / 'entities.md'
+    entities_file.write_text('See &#91;&#91;A&#93;&#93;\n\n'
+                             '!&#91;&#91;B.png&#93;&#93;\n')
+    assert get_wikilinks(entities_file) == ['A']
+    assert get_embedded_files(entities_file) == ['B.png']
+
+
+def test_plain_md_around_wikilinks():
+    md_content = 'See [[A]] and [[B|b]].\n\n- ![[C.png]]\n'
+    assert _has_only_plain_md_around_wikilinks(md_content)
+
+
+def test_non_plain_md_around_wikilinks():
+    for md_content in ['See `[[A]]`',
+                       '    [[A]] in indented code',
+                       '| [[A|a]] |\n| --- |',
+                       '[[A *b*]]',
+                       '[[A]] [a]: https://obsidian.md',
+                       '[[A\nB]]']:
+        assert not _has_only_plain_md_around_wikilinks(md_content)
+
+
+def test_html_from_md_content_has_no_state_from_previous_content():
+    actual_html = _get_html_from_md_content(
+        'See [ref][^1].\n\n[ref]: https://github.com\n[^1]: A footnote')
+    assert 'href="https://github.com"' in actual_html
+    assert 'footnote' in actual_html
+
+    # the reference & footnote defs don't carry over to the next note:
+    actual_html = _get_html_from_md_content('See [ref][^1].')
+    assert actual_html == '<p>See [ref][^1].</p>'
+
+
 def test_latex():
     html = _get_html_from_md_file(Path('.') / 'tests/general/latex.md')
     actual_latex_list = _get_all_latex_from_html_content(html)
@@ -304,6 +389,21 @@ def test_wikilinks_as_readable_text(txt_wikilink_extraction_stub):
     assert out_str == expected_str
 
 
+def test_readable_text_helpers_without_links():
+    in_str = "No [links] (here) #tag\n"
+    assert _replace_wikilinks_with_their_text(in_str) == in_str
+    assert _replace_md_links_with_their_text(in_str) == in_str
+
+
+def test_link_helpers_without_links():
+    src_txt = 'No links: [text] (url) [x] ! [ [ ] ]'
+    assert _get_all_wikilinks_from_source_text(src_txt) == []
+    assert _get_all_embedded_files_from_source_text(src_txt) == []
+    assert _get_wikilinks_and_embedded_files_from_source_text(
+        src_txt) == ([], [])
+    assert _get_all_md_link_info_from_source_text(src_txt) == []
+
+
 def test_md_links_as_readable_text(txt_md_link_extraction_stub):
     out_str = _replace_md_links_with_their_text(
         txt_md_link_extraction_stub)
@@ -324,6 +424,45 @@ def test_unique_md_links():
     assert actual_links == expected_links
 
 
+def test_md_links_need_link_syntax_in_file(tmp_path):
+    no_links_file = tmp_path / 'no links.md'
+    no_links_file.write_text('# Header\n[text] (not a link) [[wikilink]]')
+    assert get_md_links(no_links_file) == []
+
+    html_link_file = tmp_path / 'html link.md'
+    html_link_file.write_text('<a href="https://github.com">GitHub</a>')
+    assert get_md_links(html_link_file) == ['https://github.com']
+
+
+def test_md_links_keep_spaces_and_non_ascii_chars(tmp_path):
+    links_file = tmp_path / 'links.md'
+    links_file.write_text('[doc](<Docs/My File.pdf>)\n'
+                          '[Café](https://fr.wikipedia.org/wiki/Café)\n',
+                          encoding='utf-8')
+    expected_links = ['Docs/My File.pdf',
+                      'https://fr.wikipedia.org/wiki/Café']
+    assert get_md_links(links_file) == expected_links
+    assert get_unique_md_links(links_file) == expected_links
+
+
+def test_front_matter_with_separators_in_body(tmp_path):
+    fm_file = tmp_path / 'front matter.md'
+    fm_file.write_text('\n---\ntitle: A note\n---\n# Header\n\n---\n'
+                       'not: front matter\n---\n')
+    assert get_front_matter(fm_file) == {'title': 'A note'}
+
+    no_fm_file = tmp_path / 'no front matter.md'
+    no_fm_file.write_text('# Header\n\n---\nnot: front matter\n---\n')
+    assert get_front_matter(no_fm_file) == {}
+
+
+def test_front_matter_in_toml(tmp_path):
+    pytest.importorskip('toml')
+    fm_file = tmp_path / 'toml front matter.md'
+    fm_file.write_text('+++\ntitle = "A note"\n+++\n# Header\n')
+    assert get_front_matter(fm_file) == {'title': 'A note'}
+
+
 def test_readable_text_from_latex_md_stub_default_tags():
     actual_str = get_readable_text_from_md_file(
         Path('.') / 'tests/general/latex.md')
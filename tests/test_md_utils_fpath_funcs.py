@@ -4,6 +4,7 @@ import pytest
 from obsidiantools.md_utils import (_get_html_from_md_file,
                                     get_source_text_from_md_file)
 from obsidiantools.md_utils import (get_md_relpaths_from_dir,
+                                    get_md_relpaths_matching_subdirs,
                                     get_md_links,
                                     get_unique_wikilinks,
                                     get_wikilinks)
@@ -26,6 +27,36 @@ def test_get_md_relpaths_from_dir(tmp_path):
         assert p.suffix == 'md'
 
 
+def test_get_md_relpaths_from_dir_nested(tmp_path):
+    (tmp_path / 'sub' / 'subsub').mkdir(parents=True)
+    (tmp_path / '.obsidian').mkdir()
+    for p in ['root.md', 'sub/a.md', 'sub/subsub/b.md',
+              'sub/c.txt', '.obsidian/hidden.md', 'sub/.hidden.md']:
+        (tmp_path / p).write_text('')
+
+    actual_relpaths = get_md_relpaths_from_dir(tmp_path)
+    expected_relpaths = [Path('root.md'),
+                         Path('sub/a.md'),
+                         Path('sub/subsub/b.md')]
+    assert actual_relpaths == expected_relpaths
+
+
+def test_get_md_relpaths_matching_subdirs_nested(tmp_path):
+    (tmp_path / 'sub' / 'subsub').mkdir(parents=True)
+    (tmp_path / 'other').mkdir()
+    for p in ['root.md', 'sub/a.md', 'sub/subsub/b.md', 'other/c.md']:
+        (tmp_path / p).write_text('')
+
+    # only files directly in the subdirs are included:
+    actual_relpaths = get_md_relpaths_matching_subdirs(
+        tmp_path, include_subdirs=['sub/subsub/'], include_root=False)
+    assert actual_relpaths == [Path('sub/subsub/b.md')]
+
+    actual_relpaths = get_md_relpaths_matching_subdirs(
+        tmp_path, include_subdirs=['sub'])
+    assert actual_relpaths == [Path('root.md'), Path('sub/a.md')]
+
+
 def test_get_html_from_md_file(mocker_md_file):
     # test fake file open returns str
     actual_html = _get_html_from_md_file(mocker_md_file)
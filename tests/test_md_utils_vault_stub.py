@@ -2,7 +2,9 @@ import pytest
 from pathlib import Path
 
 
-from obsidiantools.md_utils import get_md_relpaths_matching_subdirs
+from obsidiantools.md_utils import (get_md_relpaths_matching_subdirs,
+                                    get_wikilinks,
+                                    _get_wikilinks_bulk)
 
 
 # NOTE: run the tests from the project dir.
@@ -37,3 +39,12 @@ def test_get_md_relpaths_matching_subdirs(actual_vault_path):
         actual_vault_path, include_subdirs=['lipsum'], include_root=False)
     assert (set(actual_w_lipsum_only).difference(actual_wo_root)
             == set())
+
+
+def test_get_wikilinks_bulk(actual_vault_path):
+    filepaths = [actual_vault_path / p
+                 for p in get_md_relpaths_matching_subdirs(actual_vault_path)]
+    expected_wikilinks = {f: get_wikilinks(f) for f in filepaths}
+
+    assert _get_wikilinks_bulk(filepaths, max_workers=1) == expected_wikilinks
+    assert _get_wikilinks_bulk(filepaths, max_workers=2) == expected_wikilinks